@@ -0,0 +1,233 @@
+"""Benchmark the compact project output against the standard one.
+
+Generates an XLSForm with thousands of fields, converts it with and without the
+compact output, then compares the conversion time, the project file size and the
+time `QgsProject.read()` takes to load each project. The standard project XML is
+checked with `check_compact_project_xml`, and the field settings of both loaded
+projects are compared to make sure the compact project opens the same.
+
+Run it with the Python interpreter QGIS uses, from the repository root, with
+`convert2qgis` and `openpyxl` installed:
+
+    python3 -m scripts.benchmark_compact_output --fields 5000 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook
+from qgis.core import (
+    QgsApplication,
+    QgsFieldConstraints,
+    QgsProcessingFeedback,
+    QgsProject,
+    QgsVectorLayer,
+)
+
+from scripts.check_compact_project import check_compact_project_xml, read_project_xml
+from xlsformconverter.xlsform_converter_algorithms import XlsformConverterAlgorithm
+
+QUESTION_TYPES = ["text", "integer", "decimal", "date", "select_one yes_no"]
+
+
+def write_xlsform(filename: Path, field_count: int) -> None:
+    workbook = Workbook()
+
+    survey = workbook.active
+    survey.title = "survey"
+    survey.append(["type", "name", "label", "required", "constraint", "default"])
+    survey.append(["geopoint", "location", "Location", "", "", ""])
+    for idx in range(field_count):
+        question_type = QUESTION_TYPES[idx % len(QUESTION_TYPES)]
+        survey.append(
+            [
+                question_type,
+                f"field_{idx}",
+                f"Field {idx}",
+                "yes" if idx % 7 == 0 else "",
+                ". > 0" if question_type == "integer" and idx % 11 == 0 else "",
+                "1" if question_type == "integer" and idx % 13 == 0 else "",
+            ]
+        )
+
+    choices = workbook.create_sheet("choices")
+    choices.append(["list_name", "name", "label"])
+    choices.append(["yes_no", "yes", "Yes"])
+    choices.append(["yes_no", "no", "No"])
+
+    settings = workbook.create_sheet("settings")
+    settings.append(["form_title", "form_id"])
+    settings.append([f"Benchmark {field_count} fields", "benchmark"])
+
+    workbook.save(filename)
+
+
+def convert(xlsform_filename: Path, output_dir: Path, compact_output: bool) -> Path:
+    algorithm = XlsformConverterAlgorithm()
+    feedback = QgsProcessingFeedback()
+
+    converter_settings = {
+        "xlsform_settings": {},
+        "author": "",
+        "use_groups_as_tabs": False,
+        "basemap_url": algorithm._get_basemap_url(0),
+        "languages": "",
+        "show_unique_label": True,
+        "crs": "EPSG:3857",
+    }
+
+    algorithm._convert_project(
+        str(xlsform_filename),
+        str(output_dir),
+        converter_settings,
+        None,
+        compact_output,
+        feedback,
+    )
+
+    project_files = list(output_dir.glob("*.qg[sz]"))
+    if len(project_files) != 1:
+        raise RuntimeError(
+            f"Expected a single project file in {output_dir}, found {project_files}"
+        )
+
+    return project_files[0]
+
+
+def load(project_filename: Path) -> tuple[float, QgsProject]:
+    project = QgsProject()
+
+    start = time.perf_counter()
+    if not project.read(str(project_filename)):
+        raise RuntimeError(f"Failed to read project {project_filename}")
+    elapsed = time.perf_counter() - start
+
+    return elapsed, project
+
+
+def field_settings(project: QgsProject) -> dict[str, list[tuple]]:
+    settings = {}
+    for layer in project.mapLayers().values():
+        if not isinstance(layer, QgsVectorLayer):
+            continue
+
+        form_config = layer.editFormConfig()
+        layer_settings = []
+        for idx, field in enumerate(layer.fields()):
+            widget_setup = field.editorWidgetSetup()
+            default_value = field.defaultValueDefinition()
+            constraints = field.constraints()
+            layer_settings.append(
+                (
+                    field.name(),
+                    widget_setup.type(),
+                    widget_setup.config(),
+                    field.alias(),
+                    default_value.expression(),
+                    default_value.applyOnUpdate(),
+                    int(constraints.constraints()),
+                    tuple(
+                        int(constraints.constraintStrength(constraint))
+                        for constraint in (
+                            QgsFieldConstraints.ConstraintNotNull,
+                            QgsFieldConstraints.ConstraintUnique,
+                            QgsFieldConstraints.ConstraintExpression,
+                        )
+                    ),
+                    constraints.constraintExpression(),
+                    constraints.constraintDescription(),
+                    form_config.labelOnTop(idx),
+                    form_config.reuseLastValue(idx),
+                    form_config.readOnly(idx),
+                )
+            )
+
+        settings[layer.name()] = layer_settings
+
+    return settings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fields", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    qgs = QgsApplication([], False)
+    qgs.initQgis()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        xlsform_filename = tmp_path.joinpath("benchmark.xlsx")
+        write_xlsform(xlsform_filename, args.fields)
+
+        results = {}
+        for mode, compact_output in (("standard", False), ("compact", True)):
+            output_dir = tmp_path.joinpath(mode)
+            output_dir.mkdir()
+
+            start = time.perf_counter()
+            project_filename = convert(xlsform_filename, output_dir, compact_output)
+            conversion_time = time.perf_counter() - start
+
+            load_times = []
+            for _ in range(args.repeat):
+                load_time, project = load(project_filename)
+                load_times.append(load_time)
+
+            results[mode] = {
+                "filename": project_filename.name,
+                "size": project_filename.stat().st_size,
+                "conversion_time": conversion_time,
+                "load_time": statistics.median(load_times),
+                "field_settings": field_settings(project),
+            }
+
+        standard_xml = read_project_xml(
+            tmp_path.joinpath("standard", results["standard"]["filename"])
+        )
+        compact_xml = read_project_xml(
+            tmp_path.joinpath("compact", results["compact"]["filename"])
+        )
+        try:
+            removed = check_compact_project_xml(standard_xml, compact_xml)
+        except ValueError as err:
+            print(err)
+            removed = None
+
+        print(f"{args.fields} fields, median of {args.repeat} loads")
+        for mode, result in results.items():
+            print(
+                f"{mode:>8}: {result['filename']:<30} "
+                f"load {result['load_time']:.3f}s, "
+                f"conversion {result['conversion_time']:.3f}s, "
+                f"{result['size'] / 1024:.0f} KiB"
+            )
+
+        print(
+            f"project XML: {len(standard_xml) / 1024:.0f} KiB -> {len(compact_xml) / 1024:.0f} KiB"
+        )
+        for tag, count in sorted((removed or {}).items()):
+            print(f"removed {count} default-valued <{tag}> elements")
+
+        identical = (
+            results["standard"]["field_settings"]
+            == results["compact"]["field_settings"]
+        )
+        print(
+            "field settings identical"
+            if identical
+            else "field settings DIFFER between standard and compact output"
+        )
+
+    qgs.exitQgis()
+
+    return 0 if identical and removed is not None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Check what the compact output removes from a generated QGIS project.
+
+Runs the project XML through `compact_project_xml` and walks both versions tag by
+tag. Every default-valued per-field element must be removed, and everything else
+apart from the indentation must be left unchanged. Does not require QGIS.
+
+Run it from the repository root on a project generated by the plugin:
+
+    python3 -m scripts.check_compact_project path/to/project.qgs
+"""
+
+import argparse
+import re
+import sys
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+from xlsformconverter.xlsform_converter_compaction import (
+    compact_project_xml,
+    is_default_valued_element,
+)
+
+_TOKEN_RE = re.compile(
+    rb"<!\[CDATA\[.*?\]\]>|<!--.*?-->|<(?:[^>\"]|\"[^\"]*\")*>|[^<]+", re.DOTALL
+)
+_SELF_CLOSING_RE = re.compile(
+    rb"<(?P<tag>[\w:.-]+)(?P<attributes>(?:\s+[\w:.-]+=\"[^\"]*\")*)\s*/>"
+)
+
+
+def read_project_xml(project_filename: Path) -> bytes:
+    if project_filename.suffix.lower() != ".qgz":
+        return project_filename.read_bytes()
+
+    with zipfile.ZipFile(project_filename) as archive:
+        for member in archive.namelist():
+            if member.lower().endswith(".qgs"):
+                return archive.read(member)
+
+    raise ValueError(
+        f"No .qgs file found within the project archive {project_filename}"
+    )
+
+
+def tokenize(content: bytes) -> list[bytes]:
+    return [
+        token
+        for token in _TOKEN_RE.findall(content)
+        # indentation between two tags
+        if token.strip() or b"\n" not in token
+    ]
+
+
+def removed_tag(token: bytes) -> bytes | None:
+    match = _SELF_CLOSING_RE.fullmatch(token)
+    if match is None or not is_default_valued_element(
+        match["tag"], match["attributes"]
+    ):
+        return None
+
+    return match["tag"]
+
+
+def check_compact_project_xml(standard: bytes, compact: bytes) -> Counter:
+    """Returns the number of removed elements per tag, raises `ValueError` on any other difference."""
+    standard_tokens = tokenize(standard)
+    compact_tokens = tokenize(compact)
+    removed: Counter = Counter()
+
+    compact_idx = 0
+    for standard_idx, token in enumerate(standard_tokens):
+        tag = removed_tag(token)
+
+        if tag is not None:
+            if (
+                compact_idx < len(compact_tokens)
+                and compact_tokens[compact_idx] == token
+            ):
+                raise ValueError(
+                    f"Default-valued element #{standard_idx} was kept: {token!r}"
+                )
+
+            removed[tag.decode()] += 1
+            continue
+
+        if compact_idx >= len(compact_tokens) or compact_tokens[compact_idx] != token:
+            found = (
+                compact_tokens[compact_idx]
+                if compact_idx < len(compact_tokens)
+                else b"end of file"
+            )
+            raise ValueError(
+                f"Compact project differs at element #{standard_idx}: expected {token!r}, found {found!r}"
+            )
+
+        compact_idx += 1
+
+    if compact_idx != len(compact_tokens):
+        raise ValueError(
+            f"Compact project has {len(compact_tokens) - compact_idx} unexpected trailing elements"
+        )
+
+    return removed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("project", type=Path)
+    args = parser.parse_args()
+
+    standard = read_project_xml(args.project)
+    compact = compact_project_xml(standard)
+
+    try:
+        removed = check_compact_project_xml(standard, compact)
+    except ValueError as err:
+        print(err)
+        return 1
+
+    print(
+        f"project XML: {len(standard) / 1024:.0f} KiB -> {len(compact) / 1024:.0f} KiB"
+    )
+    for tag, count in sorted(removed.items()):
+        print(f"removed {count} default-valued <{tag}> elements")
+    print("everything else unchanged apart from the indentation")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
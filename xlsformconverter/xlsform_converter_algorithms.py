@@ -1,4 +1,5 @@
 import os
+import zipfile
 from collections.abc import Callable
 from importlib.util import find_spec
 from pathlib import Path
@@ -30,6 +31,8 @@ from qgis.core import (
 from qgis.PyQt.QtCore import QCoreApplication, QEventLoop
 from qgis.PyQt.QtGui import QIcon
 
+from .xlsform_converter_compaction import compact_project_xml
+
 QFIELDSYNC_AVAILABLE = find_spec("plugins.qfieldsync") is not None
 
 if QFIELDSYNC_AVAILABLE:
@@ -78,6 +81,7 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
     EXTENT = "EXTENT"
     FEATURES = "FEATURES"
     SHOW_UNIQUE_LABEL = "SHOW_UNIQUE_LABEL"
+    COMPACT_OUTPUT = "COMPACT_OUTPUT"
     OUTPUT = "OUTPUT"
     OPEN_PROJECT_AFTER_CONVERSION = "OPEN_PROJECT_AFTER_CONVERSION"
 
@@ -211,6 +215,19 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
         param.setFlags(param.flags() | Qgis.ProcessingParameterFlag.Advanced)
         self.addParameter(param)
 
+        param = QgsProcessingParameterBoolean(
+            self.COMPACT_OUTPUT,
+            self.tr("Write a compact project file (.qgz)"),
+            defaultValue=False,
+        )
+        param.setHelp(
+            self.tr(
+                "Omits default-valued field settings and the XML indentation, and stores the project as a .qgz archive, which reduces the amount of XML QGIS and QField have to parse for forms with many fields"
+            )
+        )
+        param.setFlags(param.flags() | Qgis.ProcessingParameterFlag.Advanced)
+        self.addParameter(param)
+
         self.addParameter(
             QgsProcessingParameterFolderDestination(
                 self.OUTPUT,
@@ -257,6 +274,9 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
         show_unique_label = self.parameterAsBoolean(
             parameters, self.SHOW_UNIQUE_LABEL, context
         )
+        compact_output = self.parameterAsBoolean(
+            parameters, self.COMPACT_OUTPUT, context
+        )
 
         self._output_dir = self.parameterAsString(parameters, self.OUTPUT, context)
         self._should_open_project_after_conversion = self.parameterAsBoolean(
@@ -342,6 +362,7 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
             self._output_dir,
             converter_settings,
             survey_features,
+            compact_output,
             feedback,
         )
 
@@ -375,6 +396,7 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
         output_dir: str,
         converter_settings: ConverterSettings,
         survey_features: QgsProcessingFeatureSource | None,
+        compact_output: bool,
         feedback: QgsProcessingFeedback,
     ) -> None:
         try:
@@ -394,6 +416,16 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
 
         full_filename = Path(output_dir).joinpath(project.fileName())
 
+        if compact_output:
+            try:
+                full_filename = self._compact_project_file(full_filename, feedback)
+            except (OSError, ValueError, zipfile.BadZipFile) as err:
+                feedback.pushWarning(
+                    self.tr(
+                        "Failed to compact the generated project, the standard project file is kept:\n{}"
+                    ).format(err)
+                )
+
         feedback.pushFormattedMessage(
             self.tr(
                 "XLSForm converted and saved as a QGIS project at <a href='file://{0}'>{0}</a>"
@@ -403,6 +435,74 @@ class XlsformConverterAlgorithm(QgsProcessingAlgorithm):
             ),
         )
 
+    def _compact_project_file(
+        self, project_filename: Path, feedback: QgsProcessingFeedback
+    ) -> Path:
+        qgz_filename = project_filename.with_suffix(".qgz")
+        qgs_member = f"{project_filename.stem}.qgs"
+        qgd_member = f"{project_filename.stem}.qgd"
+        qgd_filename = project_filename.with_suffix(".qgd")
+        qgs_content: bytes | None = None
+        extra_members: dict[str, bytes] = {}
+
+        if project_filename.suffix.lower() == ".qgz":
+            with zipfile.ZipFile(project_filename) as archive:
+                for member in archive.namelist():
+                    if member.lower().endswith(".qgs"):
+                        qgs_member = member
+                        qgs_content = archive.read(member)
+                    else:
+                        extra_members[member] = archive.read(member)
+        else:
+            qgs_content = project_filename.read_bytes()
+
+            if qgd_filename.exists():
+                extra_members[qgd_member] = qgd_filename.read_bytes()
+
+        if qgs_content is None:
+            raise zipfile.BadZipFile(
+                f"No .qgs file found within the project archive {project_filename}"
+            )
+
+        compact_content = compact_project_xml(qgs_content)
+
+        tmp_filename = qgz_filename.with_suffix(".qgz.tmp")
+        try:
+            with zipfile.ZipFile(
+                tmp_filename, "w", compression=zipfile.ZIP_DEFLATED
+            ) as archive:
+                archive.writestr(qgs_member, compact_content)
+                for member, content in extra_members.items():
+                    archive.writestr(member, content)
+
+            tmp_filename.replace(qgz_filename)
+        except Exception:
+            tmp_filename.unlink(missing_ok=True)
+            raise
+
+        if project_filename == qgz_filename:
+            return qgz_filename
+
+        try:
+            project_filename.unlink()
+        except Exception:
+            # NOTE: never leave both the `.qgs` and the `.qgz` behind,
+            # otherwise opening or uploading the project becomes ambiguous
+            qgz_filename.unlink(missing_ok=True)
+            raise
+
+        if qgd_member in extra_members:
+            try:
+                qgd_filename.unlink()
+            except OSError as err:
+                feedback.pushWarning(
+                    self.tr(
+                        "Failed to remove the auxiliary storage file {}, it is already stored within the compact project and can be deleted:\n{}"
+                    ).format(qgd_filename, err)
+                )
+
+        return qgz_filename
+
     def _upload_to_qfieldcloud(
         self, output_dir: str | Path, feedback: QgsProcessingFeedback
     ) -> None:
@@ -0,0 +1,82 @@
+import re
+
+# NOTE: this module must not import `qgis`, so the compaction of the project XML can be checked without QGIS.
+
+# Matches sections that must be kept verbatim, self-closing per-field elements that may hold default values,
+# and the indentation between two tags, in that order of precedence.
+_COMPACT_PROJECT_RE = re.compile(
+    rb"(?P<verbatim><!\[CDATA\[.*?\]\]>|<!--.*?-->)"
+    rb"|(?P<element><(?P<tag>default|constraint|alias|field)(?P<attributes>(?:\s+[\w:.-]+=\"[^\"]*\")*)\s*/>)"
+    rb"|(?<=>)\s*\n\s*(?=<)",
+    re.DOTALL,
+)
+_ATTRIBUTE_RE = re.compile(rb"([\w:.-]+)=\"([^\"]*)\"")
+_ROOT_ELEMENT_RE = re.compile(rb"<qgis[\s>]")
+
+# Per-field elements QGIS reads back to the same value when they are missing from the project, keyed by tag name.
+# Each entry lists the attributes identifying the field and the default-valued attributes the element must hold.
+DEFAULT_VALUED_ELEMENTS: dict[bytes, list[tuple[set[bytes], dict[bytes, bytes]]]] = {
+    b"default": [({b"field"}, {b"applyOnUpdate": b"0", b"expression": b""})],
+    b"constraint": [
+        (
+            {b"field"},
+            {
+                b"constraints": b"0",
+                b"notnull_strength": b"0",
+                b"unique_strength": b"0",
+                b"exp_strength": b"0",
+            },
+        ),
+        ({b"field"}, {b"exp": b"", b"desc": b""}),
+    ],
+    b"alias": [({b"field", b"index"}, {b"name": b""})],
+    b"field": [
+        ({b"name"}, {b"labelOnTop": b"0"}),
+        ({b"name"}, {b"reuseLastValue": b"0"}),
+    ],
+}
+
+
+def is_default_valued_element(tag: bytes, attributes: bytes) -> bool:
+    attributes_map = dict(_ATTRIBUTE_RE.findall(attributes))
+
+    for identifying_keys, default_attributes in DEFAULT_VALUED_ELEMENTS.get(tag, []):
+        if attributes_map.keys() != identifying_keys | default_attributes.keys():
+            continue
+
+        if all(
+            attributes_map[key] == value for key, value in default_attributes.items()
+        ):
+            return True
+
+    return False
+
+
+def compact_project_xml(content: bytes) -> bytes:
+    """Drops default-valued per-field elements and the indentation from a QGIS project XML.
+
+    The XML is processed as text rather than parsed into a tree, so the prolog, comments, CDATA sections,
+    namespaces and attribute escaping are all written back exactly as QGIS produced them.
+    """
+    root_match = _ROOT_ELEMENT_RE.search(content)
+    if root_match is None:
+        raise ValueError("The generated file is not a QGIS project")
+
+    prolog = content[: root_match.start()]
+    body = content[root_match.start() :]
+
+    return prolog + _COMPACT_PROJECT_RE.sub(_compact_project_match, body)
+
+
+def _compact_project_match(match: re.Match) -> bytes:
+    if match["verbatim"]:
+        return match["verbatim"]
+
+    if match["element"]:
+        if is_default_valued_element(match["tag"], match["attributes"]):
+            return b""
+
+        return match["element"]
+
+    # indentation between two tags
+    return b""